@@ -1,9 +1,32 @@
+import collections
+import itertools
 import random
 import sys
 
+# --- Map Data ---
+# Static room layout; mutable per-game content lives in Game.contents
+Room = collections.namedtuple('Room', 'name exits exit_str')
+
+def _room(name, exits):
+    """Builds a Room, precomputing its exit listing since exits never change."""
+    return Room(name, exits, ", ".join(f"[{d}]" for d in exits) or 'None (Dead End)')
+
+# Room content is stored as a (kind, payload) tuple; kinds are interned so they can be compared by identity
+_BUG = sys.intern("bug")
+_FEATURE = sys.intern("feature")
+
+# --- Output Helper ---
+_SEP = "-" * 30
+
+def _emit(*lines):
+    """Writes several lines to stdout in a single call instead of one print() per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 # --- Base Entity Class ---
 class Entity:
     """Base class for all interactive objects (Player and Bugs)."""
+    __slots__ = ('name', 'max_health', 'health', 'attack')
+
     def __init__(self, name, health, attack):
         self.name = name
         self.max_health = health
@@ -15,15 +38,18 @@ class Entity:
         return self.health > 0
 
     def take_damage(self, damage):
-        """Reduces health and returns the damage taken."""
+        """Reduces health and returns the lines describing the damage taken."""
         self.health -= damage
-        print(f"[{self.name}] takes {damage} damage! Health: {max(0, self.health)}/{self.max_health}")
+        lines = [f"[{self.name}] takes {damage} damage! Health: {max(0, self.health)}/{self.max_health}"]
         if self.health <= 0:
-            print(f"--- [{self.name}] has been eliminated! ---")
+            lines.append(f"--- [{self.name}] has been eliminated! ---")
+        return lines
 
 # --- Player Class ---
 class Player(Entity):
     """The main player entity (The Developer)."""
+    __slots__ = ('inventory', 'current_location', 'features_collected')
+
     def __init__(self, name="The Developer"):
         # Corrected __init__ call
         super().__init__(name, health=100, attack=15)
@@ -37,43 +63,93 @@ class Player(Entity):
         self.features_collected += 1
         self.max_health += 5 # Permanent buff for every feature collected
         self.health = min(self.max_health, self.health + 10) # Small heal
-        print(f"\n[Feature Collected]: You implemented '{feature_name}'! (+5 Max HP, +10 HP)")
-        print(f"Current Max HP: {self.max_health}")
+        _emit(f"\n[Feature Collected]: You implemented '{feature_name}'! (+5 Max HP, +10 HP)",
+              f"Current Max HP: {self.max_health}")
 
     def show_status(self):
         """Displays the player's current stats and inventory."""
-        print("-" * 30)
-        print(f"| STATUS REPORT: {self.name}")
-        print(f"| Health: {self.health}/{self.max_health}")
-        print(f"| Attack Power: {self.attack}")
-        print(f"| Features Collected: {self.features_collected}")
-        print(f"| Inventory: {', '.join(self.inventory) if self.inventory else 'Empty'}")
-        print("-" * 30)
+        _emit(_SEP,
+              f"| STATUS REPORT: {self.name}",
+              f"| Health: {self.health}/{self.max_health}",
+              f"| Attack Power: {self.attack}",
+              f"| Features Collected: {self.features_collected}",
+              f"| Inventory: {', '.join(self.inventory) if self.inventory else 'Empty'}",
+              _SEP)
 
 # --- Bug (Enemy) Class ---
 class Bug(Entity):
     """An enemy entity (The Bug)."""
+    __slots__ = ('level',)
+
+    _NAMES = ("Runtime Error", "Segmentation Fault", "Off-by-One Loop", "Null Pointer")
+    # (health, attack) for each bug level, computed once
+    _STATS = tuple((20 + (level * 10), 5 + (level * 5)) for level in range(32))
+    # Shuffled cycle over _NAMES, built on the first bug so it honours any earlier random.seed()
+    _name_cycle = None
+
+    @staticmethod
+    def _stats_for(level):
+        """Returns the (health, attack) of a Level `level` bug."""
+        if level not in range(len(Bug._STATS)):
+            raise ValueError(f"Bug level must be between 0 and {len(Bug._STATS) - 1}, got {level}")
+        return Bug._STATS[level]
+
+    @classmethod
+    def _next_name(cls):
+        """Returns the next name from the shuffled name cycle, shuffling on first use."""
+        if cls._name_cycle is None:
+            cls._name_cycle = itertools.cycle(random.sample(cls._NAMES, len(cls._NAMES)))
+        return next(cls._name_cycle)
+
     def __init__(self, level):
-        name = random.choice(["Runtime Error", "Segmentation Fault", "Off-by-One Loop", "Null Pointer"])
-        health = 20 + (level * 10)
-        attack = 5 + (level * 5)
+        health, attack = Bug._stats_for(level)
         # Corrected __init__ call
-        super().__init__(name, health, attack)
+        super().__init__(Bug._next_name(), health, attack)
         self.level = level
         print(f"\n[BUG ALERT]: A Level {self.level} {self.name} has appeared!")
 
+# --- Combat Simulation ---
+def simulate_battle(player_health, player_attack, bug_health, bug_attack, rng=random):
+    """Runs one silent battle with the same rules as Game._attack. Returns True if the player wins."""
+    # Bind the roll function and ranges once; this loop is the hot path of batch simulations
+    randint = rng.randint
+    p_lo, p_hi = player_attack - 5, player_attack + 5
+    b_lo, b_hi = bug_attack - 3, bug_attack + 3
+    while True:
+        bug_health -= randint(p_lo, p_hi)
+        if bug_health <= 0:
+            return True
+        player_health -= randint(b_lo, b_hi)
+        if player_health <= 0:
+            return False
+
 # --- Game Logic Class ---
 class Game:
     """Manages the main game loop, map, and core mechanics."""
-    # Define the "System" map: Name, Exits (N, E, S, W), Initial Content (Bug/Feature)
-    MAP = [
-        {"name": "Main Repository", "exits": {'N': 1, 'E': 2}, "content": None},
-        {"name": "Frontend Component", "exits": {'S': 0, 'E': 3}, "content": "Bug"},
-        {"name": "Backend Service", "exits": {'W': 0, 'N': 3}, "content": "Feature: Authentication"},
-        {"name": "Database Schema", "exits": {'S': 2, 'W': 1}, "content": "Bug"},
-        {"name": "CI/CD Pipeline", "exits": {}, "content": "Feature: Automated Testing"},
-    ]
+    # Define the "System" map: Name, Exits (N, E, S, W)
+    MAP = (
+        _room("Main Repository", {'N': 1, 'E': 2}),
+        _room("Frontend Component", {'S': 0, 'E': 3}),
+        _room("Backend Service", {'W': 0, 'N': 3}),
+        _room("Database Schema", {'S': 2, 'W': 1}),
+        _room("CI/CD Pipeline", {}),
+    )
+    # Initial Content (Bug/Feature) of each room, indexed like MAP
+    CONTENT = (None, (_BUG, None), (_FEATURE, "Authentication"), (_BUG, None), (_FEATURE, "Automated Testing"))
     
+    # Help text shown by the 'help' command
+    _HELP = "\n".join([
+        _SEP,
+        "Available Commands:",
+        "  move [N/E/S/W]: Move in a direction.",
+        "  look: Check your current location and contents.",
+        "  attack: Engage a bug in combat.",
+        "  collect: Pick up a feature (item).",
+        "  status: Show player health, attack, and inventory.",
+        "  quit: Exit the game.",
+        _SEP,
+    ])
+
     # Static list of features to pull from
     FEATURE_POOL = ["User Profiles", "API Caching", "Real-time Notifications", "Data Migration Script", "Linter Configuration"]
 
@@ -81,16 +157,27 @@ class Game:
         self.player = Player()
         self.is_running = True
         self.current_bug = None
-        self.map_state = [d.copy() for d in self.MAP] # Deep copy of the map
+        self.contents = list(self.CONTENT) # Per-game copy of the room contents
         # Fill in the remaining features in the map
         feature_map_locations = [4] # CI/CD Pipeline already has one
         # Add a couple more features to the map state
-        self.map_state[2]['content'] = f"Feature: {self.FEATURE_POOL.pop(0)}" # Authentication
-        self.map_state[4]['content'] = f"Feature: {self.FEATURE_POOL.pop(0)}" # Automated Testing
+        self.contents[2] = (_FEATURE, self.FEATURE_POOL.pop(0)) # Authentication
+        self.contents[4] = (_FEATURE, self.FEATURE_POOL.pop(0)) # Automated Testing
         
-        print("--- Code Debugger Adventure: The Software Engineering RPG ---")
-        print("Goal: Collect features and squash all bugs to ship the final product!")
-        print("Type 'help' for commands.\n")
+        # Command name -> handler; every handler takes the (possibly empty) argument
+        self._dispatch = {
+            'quit': lambda _: self._quit(),
+            'help': lambda _: self._show_help(),
+            'look': lambda _: self._look(),
+            'status': lambda _: self.player.show_status(),
+            'move': self._move,
+            'attack': lambda _: self._attack(),
+            'collect': lambda _: self._collect(),
+        }
+
+        _emit("--- Code Debugger Adventure: The Software Engineering RPG ---",
+              "Goal: Collect features and squash all bugs to ship the final product!",
+              "Type 'help' for commands.\n")
         self._authenticate_user()
 
     def _authenticate_user(self):
@@ -102,45 +189,47 @@ class Game:
 
     def _look(self):
         """Prints the current location details."""
-        location = self.map_state[self.player.current_location]
-        print(f"\n[CURRENT LOCATION]: You are in the {location['name']}.")
-        
-        # Display exits
-        exit_str = ", ".join(f"[{d}]" for d in location['exits'].keys())
-        print(f"Available Exits: {exit_str if exit_str else 'None (Dead End)'}")
+        location = self.MAP[self.player.current_location]
+        lines = [f"\n[CURRENT LOCATION]: You are in the {location.name}.",
+                 # Display exits
+                 f"Available Exits: {location.exit_str}"]
         
         # Display content
-        content = location['content']
+        content = self.contents[self.player.current_location]
         if content:
-            if "Bug" in content:
+            kind, payload = content
+            if kind is _BUG:
                 # If there's a bug, initialize it for combat if not already active
-                if not self.current_bug or not self.current_bug.is_alive() or self.player.current_location != self.map_state.index(location):
-                    # Only create a new bug instance if one isn't already active in this room
-                    if not self.current_bug or not self.current_bug.is_alive():
-                         # Determine bug level based on location or progress
-                        bug_level = 1 + (self.player.features_collected // 2) + self.player.current_location // 2
-                        self.current_bug = Bug(bug_level)
-
-                print(f"!!! WARNING: A Bug detected in this module! You must 'attack' it!")
-                print(f"Bug Health: {self.current_bug.health}/{self.current_bug.max_health}")
-            elif content.startswith("Feature:"):
-                print(f"[*] Found a valuable {content}! Type 'collect' to implement it.")
+                # Only create a new bug instance if one isn't already active in this room
+                if not self.current_bug or not self.current_bug.is_alive():
+                    # Flush the location first so the bug alert prints after it
+                    _emit(*lines)
+                    lines = []
+                    # Determine bug level based on location or progress
+                    bug_level = 1 + (self.player.features_collected // 2) + self.player.current_location // 2
+                    self.current_bug = Bug(bug_level)
+
+                lines.append(f"!!! WARNING: A Bug detected in this module! You must 'attack' it!")
+                lines.append(f"Bug Health: {self.current_bug.health}/{self.current_bug.max_health}")
+            elif kind is _FEATURE:
+                lines.append(f"[*] Found a valuable Feature: {payload}! Type 'collect' to implement it.")
             else:
-                print(f"[DATA]: There is an unknown artifact here: {content}")
+                lines.append(f"[DATA]: There is an unknown artifact here: {payload}")
         else:
-            print("[STATUS]: Module clean. No outstanding issues or features.")
+            lines.append("[STATUS]: Module clean. No outstanding issues or features.")
+        _emit(*lines)
 
     def _move(self, direction):
         """Handles player movement between locations."""
         direction = direction.upper()
-        location = self.map_state[self.player.current_location]
+        location = self.MAP[self.player.current_location]
         
-        if self.current_bug and self.current_bug.is_alive() and self.map_state.index(location) == self.player.current_location:
+        if self.current_bug and self.current_bug.is_alive():
             print("\n[BLOCKED]: You must 'attack' and squash the active bug before moving!")
             return
 
-        if direction in location['exits']:
-            new_index = location['exits'][direction]
+        if direction in location.exits:
+            new_index = location.exits[direction]
             self.player.current_location = new_index
             self._look()
         else:
@@ -148,15 +237,14 @@ class Game:
 
     def _start_combat(self):
         """Initializes or continues combat with a Bug."""
-        location = self.map_state[self.player.current_location]
-        content = location['content']
+        content = self.contents[self.player.current_location]
 
-        if not content or "Bug" not in content:
+        if not content or content[0] is not _BUG:
             print("\n[DEBUGGING]: There is no bug to attack here. Proceed with caution.")
             return
 
         # Initialize the bug if it's the first attack or the bug was defeated and we are starting combat again
-        if not self.current_bug or not self.current_bug.is_alive() or self.map_state.index(location) != self.player.current_location:
+        if not self.current_bug or not self.current_bug.is_alive():
             # Determine bug level based on player progress and location
             bug_level = 1 + (self.player.features_collected // 2) + self.player.current_location // 2
             self.current_bug = Bug(bug_level)
@@ -175,38 +263,46 @@ class Game:
 
         # Player attacks first (Your Code Attack)
         player_damage = random.randint(player.attack - 5, player.attack + 5)
-        print(f"\n> You debug and commit a change, dealing {player_damage} damage to the {bug.name}!")
-        bug.take_damage(player_damage)
+        lines = [f"\n> You debug and commit a change, dealing {player_damage} damage to the {bug.name}!"]
+        lines.extend(bug.take_damage(player_damage))
 
         if not bug.is_alive():
-            print(f"\n[SUCCESS]: You have squashed the {bug.name}!")
-            self.map_state[self.player.current_location]['content'] = None # Clear the bug from the map
+            self.contents[self.player.current_location] = None # Clear the bug from the map
             self.current_bug = None
             self.player.health = min(player.max_health, player.health + 5) # Small reward heal
-            print("You receive a small health boost for eliminating the threat.")
+            lines.append(f"\n[SUCCESS]: You have squashed the {bug.name}!")
+            lines.append("You receive a small health boost for eliminating the threat.")
+            _emit(*lines)
             # After victory, show the location status
             self._look()
             return
 
         # Bug attacks back (The Bug Strikes)
         bug_damage = random.randint(bug.attack - 3, bug.attack + 3)
-        print(f"> The {bug.name} retaliates and causes a crash, dealing {bug_damage} damage to you!")
-        player.take_damage(bug_damage)
+        lines.append(f"> The {bug.name} retaliates and causes a crash, dealing {bug_damage} damage to you!")
+        lines.extend(player.take_damage(bug_damage))
 
         if not player.is_alive():
             self.is_running = False
-            print("\n[GAME OVER]: Your system crashed. The project failed. You couldn't squash the bug.")
-            print(f"You managed to collect {self.player.features_collected} features before failing.")
+            lines.append("\n[GAME OVER]: Your system crashed. The project failed. You couldn't squash the bug.")
+            lines.append(f"You managed to collect {self.player.features_collected} features before failing.")
+        _emit(*lines)
+
+    def simulate(self, n, level=1, seed=None):
+        """Simulates n battles of the current player against a Level `level` bug. Returns the number won."""
+        rng = random if seed is None else random.Random(seed)
+        player = self.player
+        bug_health, bug_attack = Bug._stats_for(level)
+        return sum(simulate_battle(player.health, player.attack, bug_health, bug_attack, rng) for _ in range(n))
 
     def _collect(self):
         """Handles collecting features/items."""
-        location = self.map_state[self.player.current_location]
-        content = location['content']
+        content = self.contents[self.player.current_location]
         
-        if content and content.startswith("Feature:"):
-            feature_name = content.split(": ")[1]
+        if content and content[0] is _FEATURE:
+            feature_name = content[1]
             self.player.add_feature(feature_name)
-            location['content'] = None # Remove the feature from the map
+            self.contents[self.player.current_location] = None # Remove the feature from the map
             
             # Check for win condition
             # Total features available are the 5 from the MAP list originally
@@ -214,11 +310,11 @@ class Game:
             
             if self.player.features_collected >= total_features_to_win:
                 self.is_running = False
-                print("\n" + "=" * 50)
-                print("!!! PROJECT SHIPPED SUCCESSFULLY !!!")
-                print("You have collected all critical features and squashed all known bugs.")
-                print(f"FINAL STATS: Max HP: {self.player.max_health}, Features: {self.player.features_collected}")
-                print("=" * 50)
+                _emit("\n" + "=" * 50,
+                      "!!! PROJECT SHIPPED SUCCESSFULLY !!!",
+                      "You have collected all critical features and squashed all known bugs.",
+                      f"FINAL STATS: Max HP: {self.player.max_health}, Features: {self.player.features_collected}",
+                      "=" * 50)
             else:
                 # After collecting, look around again
                 self._look()
@@ -226,17 +322,14 @@ class Game:
             print("\n[NOTE]: Nothing valuable to collect here.")
 
 
+    def _quit(self):
+        """Stops the main game loop."""
+        self.is_running = False
+        print("Exiting Code Debugger Adventure. Work in progress...")
+
     def _show_help(self):
         """Displays available commands."""
-        print("-" * 30)
-        print("Available Commands:")
-        print("  move [N/E/S/W]: Move in a direction.")
-        print("  look: Check your current location and contents.")
-        print("  attack: Engage a bug in combat.")
-        print("  collect: Pick up a feature (item).")
-        print("  status: Show player health, attack, and inventory.")
-        print("  quit: Exit the game.")
-        print("-" * 30)
+        _emit(self._HELP)
 
     def run(self):
         """The main game loop."""
@@ -252,21 +345,9 @@ class Game:
                 command = parts[0]
                 argument = parts[1] if len(parts) > 1 else ""
 
-                if command == 'quit':
-                    self.is_running = False
-                    print("Exiting Code Debugger Adventure. Work in progress...")
-                elif command == 'help':
-                    self._show_help()
-                elif command == 'look':
-                    self._look()
-                elif command == 'status':
-                    self.player.show_status()
-                elif command == 'move':
-                    self._move(argument)
-                elif command == 'attack':
-                    self._attack()
-                elif command == 'collect':
-                    self._collect()
+                handler = self._dispatch.get(command)
+                if handler:
+                    handler(argument)
                 else:
                     print(f"[ERROR]: Unknown command '{command}'. Type 'help' for a list of commands.")
 